@@ -1,20 +1,138 @@
 import os
-import re
+import atexit
+import multiprocessing
+from multiprocessing.util import Finalize
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 import csv # Imports the 'csv' module to enable reading and writing CSV files.
+import argparse
+
+# Imports Playwright for the optional --engine=playwright browser engine; the Selenium engine is used instead when it is not installed.
+try:
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    sync_playwright = None
+
+# Specifies the URL of the main page listing all the projects to be processed.
+MAIN_PROJECT_LIST_URL = "https://rera.odisha.gov.in/projects/project-list"
+# Defines the name of the output CSV file.
+CSV_FILE_PATH = "rera_odisha_scraped_data.csv"
+# Defines the write buffer used while rows are streamed and flushed one by one as projects finish.
+CSV_STREAM_BUFFER_SIZE = 8192
+# Defines the directory name for storing screenshots captured during errors.
+SCREENSHOTS_DIR = "screenshots_errors"
+# Enables error screenshots only when SCRAPER_SCREENSHOTS=1, since each capture is a multi-megabyte base64 transfer.
+SAVE_ERROR_SCREENSHOTS = os.getenv("SCRAPER_SCREENSHOTS", "0") == "1"
+# Defines the reduced window size used while capturing, as the screenshot payload scales with the viewport area.
+SCREENSHOT_WINDOW_SIZE = (800, 600)
+# Defines the XPaths of the project details page elements that both browser engines wait for and scrape.
+PROJECT_DETAILS_CONTAINER_XPATH = "//div[contains(@class, 'project-details') and .//h5[normalize-space()='Details of the Project']]"
+PROMOTER_TAB_XPATH = "//a[@role='tab' and normalize-space()='Promoter Details'] | //button[@role='tab' and normalize-space()='Promoter Details']"
+PROMOTER_DETAILS_CONTAINER_XPATH = "//div[contains(@class, 'promoter') and .//h5[normalize-space()='Promoter Details']]"
+PROMOTER_DETAILS_ROW_XPATH = f"{PROMOTER_DETAILS_CONTAINER_XPATH}//div[contains(@class,'card-body')]//div[contains(@class,'row') and count(.//div) > 1]"
+# Defines the XPath of the first project card's title on the list page.
+FIRST_CARD_TITLE_XPATH = "(//div[contains(@class, 'project-card')]//h5[contains(@class, 'card-title')])[1]"
+# Defines the resource types the Playwright engine does not download, matching the Firefox preferences of the Selenium engine.
+PLAYWRIGHT_BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
+# Defines the poll interval, in seconds, for Selenium waits on conditions that usually resolve within a few hundred
+# milliseconds (header visibility, tab clickability, text binding); WebDriverWait's 0.5 s default is kept for page loads.
+FAST_POLL_FREQUENCY = 0.1
+# Defines the number of worker processes, each driving its own Firefox instance.
+NUM_WORKERS = 4
+# Defines the column headers for the output CSV file; names are descriptive of their content and source.
+CSV_HEADERS = [
+    "Sanitized_Project_Identifier_From_Card",
+    "Raw_Project_Name_From_Card",
+    "Project_Name_Scraped_From_Details_Page",
+    "Project_Type_Scraped_From_Details_Page",
+    "RERA_Reg_No_Scraped_From_Details_Page",
+    "Promoter_Company_Name_Scraped",
+    "Promoter_Registration_No_Scraped"
+]
+
+# Maps the CSV columns filled from the "Details of the Project" section to their on-page labels.
+PROJECT_DETAIL_FIELDS = {
+    "Project_Name_Scraped_From_Details_Page": "Project Name",
+    "Project_Type_Scraped_From_Details_Page": "Project Type",
+    "RERA_Reg_No_Scraped_From_Details_Page": "RERA Regd. No.",
+}
+# Maps the CSV columns filled from the "Promoter Details" section to their on-page labels.
+PROMOTER_DETAIL_FIELDS = {
+    "Promoter_Company_Name_Scraped": "Company Name",
+    "Promoter_Registration_No_Scraped": "Registration No.",
+}
+
+# Precomputes the get_field_value() XPath for every known label, so the fallback path does not rebuild it per call.
+_LABEL_XPATHS = {
+    label: f".//label[normalize-space()='{label}']/following-sibling::strong[1]"
+    for label in (*PROJECT_DETAIL_FIELDS.values(), *PROMOTER_DETAIL_FIELDS.values())
+}
+
+# Reads every requested label's value from one section in a single browser round-trip.
+# Mirrors get_field_value(): the value is the first <strong> sibling after the label with the exact (whitespace-normalized) text.
+_BULK_FIELDS_SCRIPT = """
+const sec = document.evaluate(arguments[0], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+if (!sec) { return null; }
+const norm = (t) => (t || '').replace(/\\s+/g, ' ').trim();
+const labels = Array.from(sec.querySelectorAll('label'));
+const out = {};
+for (const lbl of arguments[1]) {
+    const l = labels.find(e => norm(e.textContent) === lbl);
+    let v = l ? l.nextElementSibling : null;
+    while (v && v.tagName !== 'STRONG') { v = v.nextElementSibling; }
+    out[lbl] = v ? norm(v.innerText) : '';
+}
+return out;
+"""
+
+# Translation table for sanitize_filename(): drops characters that are invalid in most file systems
+# (control characters and <>:"/\|?*) and replaces spaces with underscores for filename consistency.
+_SANITIZE_TABLE = str.maketrans({
+    **{chr(c): None for c in range(0, 32)},
+    **{c: None for c in '<>:"/\\|?*'},
+    ' ': '_',
+})
+
+# Returns the name and resolved 'View Details' URL of the first arguments[0] project cards in a single browser round-trip.
+_COLLECT_PROJECT_CARDS_SCRIPT = """
+return Array.from(document.querySelectorAll('div.project-card')).slice(0, arguments[0]).map(c => ({
+    name: ((c.querySelector('h5.card-title') || {}).innerText || '').trim(),
+    href: (c.querySelector('a.btn-primary') || {}).href || ''
+}));
+"""
+
+# Returns the promoter section container once it has rendered a visible row with child divs, or false until then;
+# handing back the container lets the caller reuse it instead of locating it again.
+_PROMOTER_READY_SCRIPT = """
+const find = (xp) => document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+const row = find(arguments[1]);
+if (!row || row.getClientRects().length === 0) { return false; }
+return find(arguments[0]) || false;
+"""
+
+# Hides any fixed navigation bar that might obscure clickable elements, using one injected stylesheet
+# rather than probing each selector with find_element; the id guard keeps repeated calls idempotent.
+_HIDE_NAVBAR_SCRIPT = """
+if (!document.getElementById('scraper-hide-navbar')) {
+    const style = document.createElement('style');
+    style.id = 'scraper-hide-navbar';
+    style.textContent = 'nav.navbar.fixed-top, nav.fixed-top, .navbar-main.fixed-top { display: none !important; }';
+    (document.head || document.documentElement).appendChild(style);
+}
+"""
+
+# Holds the WebDriver owned by the current worker process; set by _init_driver().
+_worker_driver = None
+# Holds this process's worker pool, kept alive between runs so its workers' Firefox instances are not relaunched per call.
+_WORKER_POOL = None
 
 def sanitize_filename(filename):
     """Sanitizes a string to be used as a valid filename."""
-    # Removes characters that are invalid in most file systems from the filename string.
-    filename = re.sub(r'[<>:"/\\|?*\x00-\x1F]', '', filename)
-    # Replaces space characters with underscores to ensure filename consistency.
-    filename = filename.replace(' ', '_')
-    # Truncates the filename to 100 characters to prevent overly long names.
-    return filename[:100]
+    # Removes invalid characters and replaces spaces in a single pass, then truncates to 100 characters to prevent overly long names.
+    return filename.translate(_SANITIZE_TABLE)[:100]
 
 def get_field_value(section_element, label_text, default_value="N/A"):
     """
@@ -22,8 +140,8 @@ def get_field_value(section_element, label_text, default_value="N/A"):
     within the provided section_element.
     """
     try:
-        # Defines an XPath to locate the desired <strong> value element relative to its <label>.
-        xpath = f".//label[normalize-space()='{label_text}']/following-sibling::strong[1]"
+        # Looks up (or, for an unknown label, builds) the XPath locating the desired <strong> value element relative to its <label>.
+        xpath = _LABEL_XPATHS.get(label_text) or f".//label[normalize-space()='{label_text}']/following-sibling::strong[1]"
         # Finds the specific web element using the XPath query within the given section.
         value_element = section_element.find_element(By.XPATH, xpath)
         # Extracts the text content from the found element and removes leading/trailing whitespace.
@@ -34,318 +152,609 @@ def get_field_value(section_element, label_text, default_value="N/A"):
         # Provides a fallback default value when data extraction fails.
         return default_value
 
-def process_multiple_projects(num_projects_to_process=6):
+def get_fields_bulk(driver, section_xpath, labels, default_value="N/A", section_element=None):
+    """
+    Extracts the values for several labels within the section at
+    section_xpath using a single execute_script call. Falls back to one
+    get_field_value() lookup per label if the script cannot be evaluated,
+    reusing section_element when the caller already holds it. Raises
+    NoSuchElementException if the section is no longer on the page.
+    Returns a dict mapping each label to its value.
+    """
+    try:
+        # Collects all label values inside the browser and returns them as one JSON object.
+        values = driver.execute_script(_BULK_FIELDS_SCRIPT, section_xpath, list(labels))
+    except Exception as script_err: # Handles browsers or pages where the script fails to run.
+        print(f"Bulk field extraction failed, falling back to per-field lookups. Error: {script_err}")
+        # Locates the section with Selenium (unless already provided) and reads each label individually.
+        if section_element is None:
+            section_element = driver.find_element(By.XPATH, section_xpath)
+        return {label: get_field_value(section_element, label, default_value) for label in labels}
+    if values is None:
+        # The script found no section, so any held element is stale; locating it afresh raises if it is really gone.
+        section_element = driver.find_element(By.XPATH, section_xpath)
+        return {label: get_field_value(section_element, label, default_value) for label in labels}
+    # Replaces missing or empty values with the specified default value.
+    return {label: values.get(label) or default_value for label in labels}
+
+def wait_for_nonempty_text(driver, xpath, timeout, description):
+    """
+    Waits until the element at xpath has non-empty text, i.e. until Angular
+    has filled in the value. Returns False (without raising) on timeout so
+    that scraping can still proceed with default values.
+    """
+    try:
+        # Polls the element's text; a missing element, or one Angular re-rendered between the find and the read, is simply retried.
+        WebDriverWait(
+            driver, timeout, poll_frequency=FAST_POLL_FREQUENCY,
+            ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+        ).until(
+            lambda d: d.find_element(By.XPATH, xpath).text.strip() != ""
+        )
+        return True
+    except TimeoutException: # Handles values that never get populated within the timeout.
+        print(f"Timed out waiting for {description} to be populated. Proceeding.")
+        return False
+
+def open_csv_writer(csv_file_path=CSV_FILE_PATH, buffering=CSV_STREAM_BUFFER_SIZE):
+    """
+    Opens csv_file_path for writing with the given buffer size and writes
+    the header row. Returns the open file and its csv.DictWriter.
+    """
+    # Opens the CSV file in write mode with UTF-8 encoding.
+    csvfile = open(csv_file_path, 'w', newline='', encoding='utf-8', buffering=buffering)
+    # Creates a DictWriter object to write dictionaries to CSV, using defined headers.
+    writer = csv.DictWriter(csvfile, fieldnames=CSV_HEADERS)
+    # Writes the header row to the CSV file.
+    writer.writeheader()
+    return csvfile, writer
+
+def append_csv_row(csvfile, writer, row):
+    """
+    Writes one row and flushes it to the operating system, so rows of
+    finished projects survive a later crash; no fsync is issued.
+    """
+    writer.writerow(row)
+    csvfile.flush()
+
+def _project_entries_from_cards(cards):
+    """
+    Converts the {name, href} dicts returned by _COLLECT_PROJECT_CARDS_SCRIPT
+    into (project_index, detail_url, raw_project_name) tuples, using "N/A"
+    for a missing name and None for a missing link.
+    """
+    project_entries = []
+    for card_index, card in enumerate(cards):
+        if not card.get("href"):
+            print(f"Could not read 'View Details' link from card {card_index}.")
+        project_entries.append((card_index, card.get("href") or None, card.get("name") or "N/A"))
+    return project_entries
+
+def _promoter_ready(driver):
+    """
+    WebDriverWait condition: returns the promoter details container element
+    once its content is rendered and visible, or False until then.
+    """
+    return driver.execute_script(_PROMOTER_READY_SCRIPT, PROMOTER_DETAILS_CONTAINER_XPATH, PROMOTER_DETAILS_ROW_XPATH)
+
+def hide_navbar(driver):
+    """Hides fixed navigation bars on the current page so they cannot intercept clicks."""
+    try:
+        driver.execute_script(_HIDE_NAVBAR_SCRIPT)
+    except Exception as nav_e: # Proceeds without hiding; the navbar only matters if it overlaps the tab being clicked.
+        print(f"Could not hide navbar, proceeding. Error: {nav_e}")
+
+def save_error_screenshot(driver, filename):
+    """
+    Saves a PNG of the current page to SCREENSHOTS_DIR/filename if error
+    screenshots are enabled. Returns True if a screenshot was written;
+    failures are logged rather than raised.
+    """
+    if not SAVE_ERROR_SCREENSHOTS:
+        return False
+    try:
+        # Shrinks the window for the capture and restores it afterwards.
+        original_size = driver.get_window_size()
+        driver.set_window_size(*SCREENSHOT_WINDOW_SIZE)
+        try:
+            png_bytes = driver.get_screenshot_as_png()
+        finally:
+            driver.set_window_size(original_size["width"], original_size["height"])
+        # Writes the PNG bytes as received, without re-encoding.
+        with open(os.path.join(SCREENSHOTS_DIR, filename), 'wb') as screenshot_file:
+            screenshot_file.write(png_bytes)
+        print(f"Saved error screenshot: {filename}")
+        return True
+    except Exception as save_err: # Handles failure to capture or write the screenshot.
+        print(f"Could not save error screenshot '{filename}': {save_err}")
+        return False
+
+def create_firefox_driver():
+    """Creates a Firefox WebDriver configured for scraping."""
     options = webdriver.FirefoxOptions()
-    # Configures Firefox to run in headless mode (no GUI) if this line is uncommented by the user.
-    # options.add_argument("--headless")
-    driver = webdriver.Firefox(options=options)
+    # Configures Firefox to run in headless mode (no GUI); the scraper never needs an interactive window.
+    options.add_argument("--headless")
+    # Returns from driver.get() at DOMContentLoaded instead of waiting for every subresource; explicit waits cover rendering.
+    options.page_load_strategy = "eager"
+    # Blocks image downloads, since only the text of labels and values is scraped.
+    options.set_preference("permissions.default.image", 2)
+    # Renders with local fonts instead of downloading the site's web fonts.
+    options.set_preference("browser.display.use_document_fonts", 0)
+    # Blocks autoplaying audio and video.
+    options.set_preference("media.autoplay.default", 5)
+    # Skips writing fetched resources to the on-disk cache (the in-memory cache remains in use).
+    options.set_preference("browser.cache.disk.enable", False)
+    # Pins Selenium 4's default keep_alive=True, so the HTTP connection to geckodriver stays reused across commands.
+    driver = webdriver.Firefox(options=options, keep_alive=True)
+    # Disables implicit waiting so a missing element raises immediately; every wait in this script is an explicit WebDriverWait.
+    driver.implicitly_wait(0)
     # Sets the browser window size to ensure consistent layout and element visibility.
     driver.set_window_size(1920, 1200)
+    return driver
 
-    # Defines the directory name for storing screenshots captured during errors.
-    screenshots_dir = "screenshots_errors"
-    # Creates the error screenshots directory if it does not already exist on the filesystem.
-    if not os.path.exists(screenshots_dir):
-        os.makedirs(screenshots_dir)
-        print(f"Created directory for error screenshots: {screenshots_dir}")
-    else:
-        print(f"Directory for error screenshots '{screenshots_dir}' already exists.")
-
-    # Specifies the URL of the main page listing all the projects to be processed.
-    main_project_list_url = "https://rera.odisha.gov.in/projects/project-list"
-
-    # Initializes an empty list to store dictionaries, each holding data for one scraped project.
-    all_projects_scraped_data = []
-    # Defines the column headers for the output CSV file; names are descriptive of their content and source.
-    csv_headers = [
-        "Sanitized_Project_Identifier_From_Card",
-        "Raw_Project_Name_From_Card",
-        "Project_Name_Scraped_From_Details_Page",
-        "Project_Type_Scraped_From_Details_Page",
-        "RERA_Reg_No_Scraped_From_Details_Page",
-        "Promoter_Company_Name_Scraped",
-        "Promoter_Registration_No_Scraped"
-    ]
+def _quit_worker_driver():
+    """Closes the browser owned by the current worker process, if any."""
+    global _worker_driver
+    if _worker_driver is not None and _worker_driver.session_id:
+        try:
+            _worker_driver.quit()
+        except Exception as quit_err: # Handles a browser that has already gone away.
+            print(f"Could not quit worker browser cleanly: {quit_err}")
+    _worker_driver = None
+
+def _init_driver():
+    """
+    Pool initializer: starts one Firefox instance per worker process and
+    arranges for it to be closed when the worker exits.
+    """
+    global _worker_driver
+    # Registers the cleanup with multiprocessing, since pool workers exit without running atexit handlers.
+    Finalize(None, _quit_worker_driver, exitpriority=10)
+    try:
+        _worker_driver = create_firefox_driver()
+    except Exception as init_err: # Leaves the worker without a browser instead of crashing (which would make the pool respawn it forever).
+        print(f"Worker {os.getpid()} could not start Firefox: {type(init_err).__name__} - {str(init_err)}")
+        _worker_driver = None
 
+def _worker_browser():
+    """
+    Returns the current worker's WebDriver, replacing it with a fresh
+    Firefox if it is missing, crashed or no longer answers commands.
+    Returns None if no browser can be started.
+    """
+    global _worker_driver
+    if _worker_driver is not None:
+        try:
+            # Makes one cheap round-trip, since a crashed or hung browser still keeps its session_id.
+            _worker_driver.title
+            return _worker_driver
+        except Exception as probe_err: # Handles a browser that no longer answers commands.
+            print(f"Worker {os.getpid()} browser is unresponsive ({type(probe_err).__name__}); restarting it.")
+            _quit_worker_driver()
+    try:
+        _worker_driver = create_firefox_driver()
+    except Exception as init_err: # Leaves the worker without a browser; the caller skips its task.
+        print(f"Worker {os.getpid()} could not start Firefox: {type(init_err).__name__} - {str(init_err)}")
+        _worker_driver = None
+    return _worker_driver
+
+def get_worker_pool():
+    """
+    Returns this process's pool of NUM_WORKERS worker processes, starting
+    it (and one Firefox per worker) on first use only; later calls reuse
+    the same workers and browsers.
+    """
+    global _WORKER_POOL
+    if _WORKER_POOL is None:
+        _WORKER_POOL = multiprocessing.Pool(processes=NUM_WORKERS, initializer=_init_driver)
+    return _WORKER_POOL
+
+def _close_worker_pool():
+    """Lets the pooled workers exit normally when the interpreter exits, so each one closes its browser."""
+    global _WORKER_POOL
+    if _WORKER_POOL is not None:
+        _WORKER_POOL.close()
+        _WORKER_POOL.join()
+        _WORKER_POOL = None
+
+# Runs before multiprocessing's own exit handler (registered earlier), which would terminate the workers without cleanup.
+atexit.register(_close_worker_pool)
+
+def collect_project_entries(num_projects_to_process):
+    """
+    Loads the project list page in the worker's WebDriver and returns the
+    first num_projects_to_process cards as (project_index, detail_url,
+    raw_project_name) tuples, or None if the list could not be read.
+    """
+    driver = _worker_browser()
+    if driver is None:
+        print(f"!!! No browser available in worker {os.getpid()}; cannot load the project list.")
+        return None
     try:
         # Navigates the web driver to the main project listing URL.
         print("STEP 1: Loading main project list page")
-        driver.get(main_project_list_url)
+        driver.get(MAIN_PROJECT_LIST_URL)
         # Waits for the project cards to be present, ensuring the page is substantially loaded.
         WebDriverWait(driver, 30).until(
             EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.project-card"))
         )
         print("Main project list page loaded.")
-        # Allows a brief pause for any dynamic content on the page to settle.
-        time.sleep(3)
+        # Waits for the card titles to be rendered, since the cards are inserted before their text is bound.
+        wait_for_nonempty_text(driver, FIRST_CARD_TITLE_XPATH, 15, "project card titles")
+
+        # Collects the name and detail-page URL of every project card in a single pass over the list page.
+        print("STEP 2: Collecting project detail links from the list page")
+        # Reads every needed card's name and link in one execute_script call, yielding (project_index, detail_url, raw_project_name) tuples.
+        project_entries = _project_entries_from_cards(
+            driver.execute_script(_COLLECT_PROJECT_CARDS_SCRIPT, num_projects_to_process)
+        )
+        print(f"Collected {len(project_entries)} project link(s) (requested {num_projects_to_process}).")
+        return project_entries
+    except Exception as list_e: # Handles a list page that fails to load or render.
+        print(f"An critical unexpected error occurred while loading the project list: {type(list_e).__name__} - {str(list_e)}")
+        # Attempts to save a screenshot of the list page at the time of the error.
+        save_error_screenshot(driver, "critical_error_page_main_script_failure.png")
+        return None
+
+def scrape_one(project_entry):
+    """
+    Scrapes the details and promoter sections of a single project using the
+    worker's WebDriver. project_entry is a (project_index, detail_url,
+    raw_project_name) tuple; returns a dict keyed by CSV_HEADERS.
+    """
+    project_index, detail_url, raw_name_from_entry = project_entry
+    # Uses the worker's browser, restarting it first if a previous task left it crashed or hung.
+    driver = _worker_browser()
+    # Sets a default identifier for logging, used if project name extraction fails.
+    project_identifier_for_log = f"Project_Loop_{project_index + 1}"
+    # Initializes the variable for the raw project name extracted from the card.
+    raw_project_name_from_card = "N/A"
+
+    # Initializes a dictionary to store all scraped data for the current project, with default "N/A" values.
+    current_project_data_dict = {header: "N/A" for header in CSV_HEADERS}
+
+    print(f"\n--- Processing Project Loop Index {project_index} (worker {os.getpid()}) ---")
+
+    # Updates identifiers if a valid project name was extracted from the card.
+    if raw_name_from_entry != "N/A":
+        raw_project_name_from_card = raw_name_from_entry
+        project_identifier_for_log = sanitize_filename(raw_name_from_entry)
+    print(f"Identified Project Name (Card): '{raw_project_name_from_card}' (Identifier: '{project_identifier_for_log}')")
+
+    # Stores the determined project identifier and raw name in the data dictionary using descriptive headers.
+    current_project_data_dict["Sanitized_Project_Identifier_From_Card"] = project_identifier_for_log
+    current_project_data_dict["Raw_Project_Name_From_Card"] = raw_project_name_from_card
+
+    # Skips scraping if this worker failed to start its browser.
+    if driver is None:
+        print(f"!!! No browser available in worker {os.getpid()}; skipping '{project_identifier_for_log}'.")
+        return current_project_data_dict
+
+    try:
+        # Checks that a detail URL was collected for this card before navigating.
+        if not detail_url:
+            raise ValueError("No 'View Details' URL was collected for this project card.")
+
+        # Opens the project's details page directly instead of clicking through the list page.
+        print(f"STEP {project_index+1}.B: Opening details page for '{project_identifier_for_log}': {detail_url}")
+        driver.get(detail_url)
+        # Hides the fixed navbar on this page before anything is clicked; the stylesheet does not survive navigation.
+        hide_navbar(driver)
+
+        # Verifies that the project details page has loaded by checking for a specific header.
+        print(f"STEP {project_index+1}.C: Verifying details page and waiting for content for '{project_identifier_for_log}'")
+        # Waits until the project details section (which contains its header) is visible, keeping the element for step D.
+        project_details_section_element = WebDriverWait(driver, 40, poll_frequency=FAST_POLL_FREQUENCY).until(
+            EC.visibility_of_element_located((By.XPATH, PROJECT_DETAILS_CONTAINER_XPATH))
+        )
+        print("Details page (initial tab) header loaded successfully.")
+        # Waits for Angular to fill in the project name instead of pausing for a fixed time.
+        wait_for_nonempty_text(
+            driver,
+            f"{PROJECT_DETAILS_CONTAINER_XPATH}//label[normalize-space()='Project Name']/following-sibling::strong[1]",
+            15, "project details"
+        )
 
-        # Attempts to hide any fixed navigation bar that might obscure clickable elements.
-        print("STEP 2: Hiding navbar (if it obscures elements)")
+        # Attempts to scrape data from the "Details of the Project" section.
+        print(f"STEP {project_index+1}.D: Scraping Project Details section for '{project_identifier_for_log}'")
         try:
-            # Defines a list of common CSS selectors used for fixed navigation bars.
-            navbar_selectors = ["nav.navbar.fixed-top", "nav.fixed-top", ".navbar-main.fixed-top"]
-            navbar_hidden = False
-            # Iterates through the selectors to find and hide a visible navigation bar.
-            for selector in navbar_selectors:
-                try:
-                    # Finds the navigation bar element using the current CSS selector.
-                    navbar = driver.find_element(By.CSS_SELECTOR, selector)
-                    # Checks if the found navigation bar is currently displayed.
-                    if navbar.is_displayed():
-                        # Hides the navigation bar using JavaScript if it is visible.
-                        driver.execute_script("arguments[0].style.display = 'none';", navbar)
-                        print(f"Navbar hidden using selector: '{selector}'.")
-                        navbar_hidden = True
-                        # Pauses briefly after hiding the navbar to allow the page to adjust.
-                        time.sleep(1)
-                        # Exits the loop once a navigation bar has been successfully hidden.
-                        break
-                except: # Catches exceptions if a selector doesn't find an element, allowing iteration to continue.
-                    continue # Proceeds to the next selector if the current one fails.
-            # Checks if a navigation bar was successfully hidden during the attempts.
-            if not navbar_hidden:
-                print("Navbar not found with common selectors or not displayed. Proceeding.")
-        except Exception as nav_e: # Catches any other exceptions during the navbar hiding process.
-            print(f"Could not hide navbar, proceeding. Error: {nav_e}")
-
-        # Iterates through the specified number of projects to process them one by one.
-        for i in range(num_projects_to_process):
-            # Sets a default identifier for logging, used if project name extraction fails.
-            project_identifier_for_log = f"Project_Loop_{i + 1}"
-            # Initializes the variable for the raw project name extracted from the card.
-            raw_project_name_from_card = "N/A"
-
-            # Initializes a dictionary to store all scraped data for the current project, with default "N/A" values.
-            current_project_data_dict = {header: "N/A" for header in csv_headers}
-
-            print(f"\n--- Processing Project Loop Index {i} ---")
+            # Scrapes all fields of the project details section (already confirmed visible in step C) in one round-trip.
+            project_values = get_fields_bulk(
+                driver, PROJECT_DETAILS_CONTAINER_XPATH, PROJECT_DETAIL_FIELDS.values(),
+                section_element=project_details_section_element
+            )
+            for header, label in PROJECT_DETAIL_FIELDS.items():
+                current_project_data_dict[header] = project_values[label]
+            print(f"  Scraped - Project Name: {current_project_data_dict['Project_Name_Scraped_From_Details_Page']},"
+                  f" Type: {current_project_data_dict['Project_Type_Scraped_From_Details_Page']},"
+                  f" RERA No: {current_project_data_dict['RERA_Reg_No_Scraped_From_Details_Page']}")
+        except Exception as scrape_details_e: # Handles errors encountered during scraping of project details.
+            print(f"ERROR scraping project details for '{project_identifier_for_log}': {type(scrape_details_e).__name__} - {str(scrape_details_e)}")
+            # Saves a screenshot if an error occurs while scraping this section.
+            save_error_screenshot(driver, f"{project_identifier_for_log}_error_scraping_project_details.png")
+
+        # Navigates to the "Promoter Details" tab on the project details page.
+        print(f"STEP {project_index+1}.E: Switching to Promoter Details for '{project_identifier_for_log}'")
+        # Waits for the 'Promoter Details' tab to be clickable.
+        promoter_tab_element = WebDriverWait(driver, 30, poll_frequency=FAST_POLL_FREQUENCY).until(
+            EC.element_to_be_clickable((By.XPATH, PROMOTER_TAB_XPATH))
+        )
+        # Scrolls the 'Promoter Details' tab into view before clicking (instantly, so there is no animation to wait out).
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", promoter_tab_element)
+        # Confirms the tab is still clickable at its scrolled position.
+        promoter_tab_element = WebDriverWait(driver, 10, poll_frequency=FAST_POLL_FREQUENCY).until(
+            EC.element_to_be_clickable((By.XPATH, PROMOTER_TAB_XPATH))
+        )
+        promoter_tab_element.click() # Clicks the tab to switch views.
+        print("'Promoter Details' tab clicked.")
+
+        # Waits for the content of the "Promoter Details" section to load after tab switch.
+        print(f"STEP {project_index+1}.F: Waiting for Promoter Details content load for '{project_identifier_for_log}'")
+        # Waits, with one script round-trip per poll, for the promoter section to render a visible row with child divs.
+        promoter_details_section_element = WebDriverWait(driver, 40, poll_frequency=0.25).until(_promoter_ready)
+        print("Promoter details content seems loaded.")
+        # Waits for Angular to fill in the company name instead of pausing for a fixed time.
+        wait_for_nonempty_text(
+            driver,
+            f"{PROMOTER_DETAILS_CONTAINER_XPATH}//label[normalize-space()='Company Name']/following-sibling::strong[1]",
+            15, "promoter details"
+        )
 
-            try:
-                # Ensures the driver is on the main project list page before processing each new project.
-                if driver.current_url != main_project_list_url:
-                    print(f"Not on main project list page. Navigating back to {main_project_list_url}")
-                    # Navigates back to the main project list page if the driver is on a different URL.
-                    driver.get(main_project_list_url)
-
-                # Waits for project card elements to be present, confirming the list page is ready.
-                WebDriverWait(driver, 30).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.project-card"))
-                )
-                # Pauses briefly for elements to settle after potential page reload.
-                time.sleep(2)
-
-                # Retrieves all project card elements visible on the current page.
-                project_cards = driver.find_elements(By.CSS_SELECTOR, "div.project-card")
-
-                # Checks if enough project cards are available on the page for the current iteration.
-                if i >= len(project_cards):
-                    print(f"Not enough project cards found on the page to process project index {i}. Found {len(project_cards)}.")
-                    # Stops processing if the requested project index is out of bounds.
-                    break
-
-                # Selects the specific project card for the current iteration.
-                current_project_card = project_cards[i]
-
-                # Attempts to extract the project's name from its card for logging and data.
-                try:
-                    # Locates the h5 element containing the project title within the current card.
-                    project_name_element = current_project_card.find_element(By.CSS_SELECTOR, "h5.card-title")
-                    # Extracts and strips the text of the project name from the element.
-                    temp_raw_name = project_name_element.text.strip()
-                    # Updates identifiers if a valid project name is successfully extracted.
-                    if temp_raw_name:
-                        raw_project_name_from_card = temp_raw_name
-                        project_identifier_for_log = sanitize_filename(temp_raw_name)
-                    print(f"Identified Project Name (Card): '{raw_project_name_from_card}' (Identifier: '{project_identifier_for_log}')")
-                except Exception as name_ex: # Handles cases where the project name cannot be extracted from the card.
-                    print(f"Could not extract project name from card, using default identifier: '{project_identifier_for_log}'. Error: {name_ex}")
-
-                # Stores the determined project identifier and raw name in the data dictionary using descriptive headers.
-                current_project_data_dict["Sanitized_Project_Identifier_From_Card"] = project_identifier_for_log
-                current_project_data_dict["Raw_Project_Name_From_Card"] = raw_project_name_from_card
-
-                # Scrolls the current project card into view to ensure it's clickable.
-                print(f"STEP {i+1}.A: Scrolling to project: '{project_identifier_for_log}'")
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", current_project_card)
-                # Waits for the scroll animation and any lazy loading to complete.
-                time.sleep(2)
-
-                # Clicks the 'View Details' button on the project card to navigate to its details page.
-                print(f"STEP {i+1}.B: Clicking 'View Details' for '{project_identifier_for_log}'")
-                # Waits for the 'View Details' button to become clickable before interacting.
-                view_details_button = WebDriverWait(current_project_card, 20).until(
-                    EC.element_to_be_clickable((By.XPATH, ".//a[contains(@class, 'btn-primary') and normalize-space()='View Details']"))
-                )
-                view_details_button.click()
-                print("'View Details' button clicked.")
-
-                # Verifies that the project details page has loaded by checking for a specific header.
-                print(f"STEP {i+1}.C: Verifying details page and waiting for content for '{project_identifier_for_log}'")
-                # Defines the XPath for the header element on the project details page.
-                project_details_header_xpath = "//h5[normalize-space()='Details of the Project']"
-                # Waits until the project details header is visible on the page.
-                WebDriverWait(driver, 40).until(
-                    EC.visibility_of_element_located((By.XPATH, project_details_header_xpath))
-                )
-                print("Details page (initial tab) header loaded successfully.")
-                # Allows extra time for JavaScript or Angular content to fully render on the details page.
-                time.sleep(4)
-
-                # Attempts to scrape data from the "Details of the Project" section.
-                print(f"STEP {i+1}.D: Scraping Project Details section for '{project_identifier_for_log}'")
-                try:
-                    # Defines XPath for the container of the project details section.
-                    project_details_container_xpath = "//div[contains(@class, 'project-details') and .//h5[normalize-space()='Details of the Project']]"
-                    # Waits for the project details section container to become visible.
-                    project_details_section_element = WebDriverWait(driver, 30).until(
-                        EC.visibility_of_element_located((By.XPATH, project_details_container_xpath))
-                    )
-                    # Scrapes specific fields from the project details section using the helper function.
-                    current_project_data_dict["Project_Name_Scraped_From_Details_Page"] = get_field_value(project_details_section_element, "Project Name")
-                    current_project_data_dict["Project_Type_Scraped_From_Details_Page"] = get_field_value(project_details_section_element, "Project Type")
-                    current_project_data_dict["RERA_Reg_No_Scraped_From_Details_Page"] = get_field_value(project_details_section_element, "RERA Regd. No.")
-                    print(f"  Scraped - Project Name: {current_project_data_dict['Project_Name_Scraped_From_Details_Page']},"
-                          f" Type: {current_project_data_dict['Project_Type_Scraped_From_Details_Page']},"
-                          f" RERA No: {current_project_data_dict['RERA_Reg_No_Scraped_From_Details_Page']}")
-                except Exception as scrape_details_e: # Handles errors encountered during scraping of project details.
-                    print(f"ERROR scraping project details for '{project_identifier_for_log}': {type(scrape_details_e).__name__} - {str(scrape_details_e)}")
-                    # Saves a screenshot if an error occurs while scraping this section.
-                    driver.save_screenshot(os.path.join(screenshots_dir, f"{project_identifier_for_log}_error_scraping_project_details.png"))
-                # Pauses briefly after attempting to scrape.
-                time.sleep(1)
-
-                # Navigates to the "Promoter Details" tab on the project details page.
-                print(f"STEP {i+1}.E: Switching to Promoter Details for '{project_identifier_for_log}'")
-                # Defines an XPath targeting the 'Promoter Details' tab link or button.
-                promoter_tab_link_xpath = "//a[@role='tab' and normalize-space()='Promoter Details'] | //button[@role='tab' and normalize-space()='Promoter Details']"
-                # Waits for the 'Promoter Details' tab to be clickable.
-                promoter_tab_element = WebDriverWait(driver, 30).until(
-                    EC.element_to_be_clickable((By.XPATH, promoter_tab_link_xpath))
-                )
-                # Scrolls the 'Promoter Details' tab into view before clicking.
-                driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", promoter_tab_element)
-                time.sleep(1) # Allows time for scrolling to complete.
-                promoter_tab_element.click() # Clicks the tab to switch views.
-                print("'Promoter Details' tab clicked.")
-
-                # Waits for the content of the "Promoter Details" section to load after tab switch.
-                print(f"STEP {i+1}.F: Waiting for Promoter Details content load for '{project_identifier_for_log}'")
-                # Defines XPath for the container of the promoter details section.
-                promoter_details_container_xpath_for_wait = "//div[contains(@class, 'promoter') and .//h5[normalize-space()='Promoter Details']]"
-                # Waits for the promoter details section container to become visible.
-                WebDriverWait(driver, 40).until(
-                    EC.visibility_of_element_located((By.XPATH, promoter_details_container_xpath_for_wait))
-                )
-                # Further waits for specific content (a row with child divs) within the promoter details body to ensure it's rendered.
-                WebDriverWait(driver, 20).until(
-                    EC.visibility_of_element_located((By.XPATH, f"{promoter_details_container_xpath_for_wait}//div[contains(@class,'card-body')]//div[contains(@class,'row') and count(.//div) > 1]"))
-                )
-                print("Promoter details content seems loaded.")
-                # Allows extra time for JavaScript or Angular content to fully render in this section.
-                time.sleep(4)
-
-                # Attempts to scrape data from the "Promoter Details" section.
-                print(f"STEP {i+1}.G: Scraping Promoter Details section for '{project_identifier_for_log}'")
-                try:
-                    # Waits for the promoter details section element to be visible again (or confirms visibility).
-                    promoter_details_section_element = WebDriverWait(driver, 30).until(
-                        EC.visibility_of_element_located((By.XPATH, promoter_details_container_xpath_for_wait))
-                    )
-                    # Scrapes specific fields from the promoter details section.
-                    current_project_data_dict["Promoter_Company_Name_Scraped"] = get_field_value(promoter_details_section_element, "Company Name")
-                    current_project_data_dict["Promoter_Registration_No_Scraped"] = get_field_value(promoter_details_section_element, "Registration No.")
-                    print(f"  Scraped - Promoter Co. Name: {current_project_data_dict['Promoter_Company_Name_Scraped']},"
-                          f" Promoter Reg. No: {current_project_data_dict['Promoter_Registration_No_Scraped']}")
-                except Exception as scrape_promoter_e: # Handles errors encountered during scraping of promoter details.
-                    print(f"ERROR scraping promoter details for '{project_identifier_for_log}': {type(scrape_promoter_e).__name__} - {str(scrape_promoter_e)}")
-                    # Saves a screenshot if an error occurs while scraping this section.
-                    driver.save_screenshot(os.path.join(screenshots_dir, f"{project_identifier_for_log}_error_scraping_promoter_details.png"))
-                # Pauses briefly after attempting to scrape.
-                time.sleep(1)
-
-                # Appends the scraped data (or defaults) for the current project to the main list.
-                all_projects_scraped_data.append(current_project_data_dict)
-
-                # Navigates back to the main project listing page to process the next project.
-                print(f"STEP {i+1}.H: Returning to main project list page from '{project_identifier_for_log}'s details.")
-                driver.back()
-                # Waits for the project cards to reload on the main list page after navigating back.
-                WebDriverWait(driver, 40).until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.project-card"))
-                )
-                print("Successfully returned to main project list page.")
-                # Pauses to allow the main list page to settle before starting the next iteration.
-                time.sleep(3)
-
-            except Exception as project_loop_e: # Handles any unexpected errors during the processing of a single project.
-                print(f"!!! ERROR processing project loop for '{project_identifier_for_log}' (Project index {i}): {type(project_loop_e).__name__} - {str(project_loop_e)}")
-                # Defines a filename for the error screenshot related to this project loop failure.
-                error_ss_filename = f"{project_identifier_for_log}_MAIN_LOOP_ERROR.png"
-                try:
-                    # Attempts to save a screenshot of the page state at the time of the error.
-                    driver.save_screenshot(os.path.join(screenshots_dir, error_ss_filename))
-                    print(f"Saved error screenshot: {error_ss_filename}")
-                except Exception as save_err: # Handles failure to save the error screenshot.
-                    print(f"Could not save error screenshot: {save_err}")
-
-                # Appends partially collected data or default values for this project if an error occurred mid-process.
-                all_projects_scraped_data.append(current_project_data_dict)
-
-                # Attempts to recover by navigating back to the main project list page to continue.
-                print("Attempting to navigate back to project list to continue with the next project...")
-                try:
-                    driver.get(main_project_list_url)
-                    # Waits for project cards to ensure the main list page is loaded after recovery attempt.
-                    WebDriverWait(driver, 30).until(
-                        EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.project-card"))
-                    )
-                    print("Successfully navigated back to project list after error.")
-                    # Pauses to let the page settle after recovery.
-                    time.sleep(3)
-                except Exception as nav_back_err: # Handles failure to navigate back to the project list after an error.
-                    print(f"Failed to navigate back to project list after error: {nav_back_err}. Aborting further projects.")
-                    # Terminates the project processing loop if recovery fails.
-                    break
-        # Indicates that all specified projects have been attempted.
-        print("\nAll specified projects processed (or attempted).")
+        # Attempts to scrape data from the "Promoter Details" section.
+        print(f"STEP {project_index+1}.G: Scraping Promoter Details section for '{project_identifier_for_log}'")
+        try:
+            # Scrapes all fields of the promoter details section (already confirmed visible in step F) in one round-trip.
+            promoter_values = get_fields_bulk(
+                driver, PROMOTER_DETAILS_CONTAINER_XPATH, PROMOTER_DETAIL_FIELDS.values(),
+                section_element=promoter_details_section_element
+            )
+            for header, label in PROMOTER_DETAIL_FIELDS.items():
+                current_project_data_dict[header] = promoter_values[label]
+            print(f"  Scraped - Promoter Co. Name: {current_project_data_dict['Promoter_Company_Name_Scraped']},"
+                  f" Promoter Reg. No: {current_project_data_dict['Promoter_Registration_No_Scraped']}")
+        except Exception as scrape_promoter_e: # Handles errors encountered during scraping of promoter details.
+            print(f"ERROR scraping promoter details for '{project_identifier_for_log}': {type(scrape_promoter_e).__name__} - {str(scrape_promoter_e)}")
+            # Saves a screenshot if an error occurs while scraping this section.
+            save_error_screenshot(driver, f"{project_identifier_for_log}_error_scraping_promoter_details.png")
+
+    except Exception as project_loop_e: # Handles any unexpected errors during the processing of a single project.
+        print(f"!!! ERROR processing project loop for '{project_identifier_for_log}' (Project index {project_index}): {type(project_loop_e).__name__} - {str(project_loop_e)}")
+        # Saves a screenshot of the page state at the time of the error.
+        save_error_screenshot(driver, f"{project_identifier_for_log}_MAIN_LOOP_ERROR.png")
+
+    # Returns the scraped data (or partially collected defaults) for the current project to the parent process.
+    return current_project_data_dict
+
+def _playwright_run_script(page, script, *args):
+    """
+    Runs a script written for Selenium's execute_script (which reads its
+    inputs from `arguments`) in a Playwright page and returns its result.
+    """
+    return page.evaluate("(args) => (function () {" + script + "}).apply(null, args)", list(args))
+
+def _playwright_wait_for_nonempty_text(page, xpath, timeout_ms, description):
+    """Playwright counterpart of wait_for_nonempty_text(); returns False on timeout."""
+    try:
+        page.wait_for_function(
+            "(xp) => { const n = document.evaluate(xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;"
+            " return !!n && n.innerText.trim() !== ''; }",
+            arg=xpath, timeout=timeout_ms
+        )
+        return True
+    except PlaywrightTimeoutError: # Handles values that never get populated within the timeout.
+        print(f"Timed out waiting for {description} to be populated. Proceeding.")
+        return False
+
+def _playwright_save_error_screenshot(page, filename):
+    """Playwright counterpart of save_error_screenshot(); honours SCRAPER_SCREENSHOTS as well."""
+    if not SAVE_ERROR_SCREENSHOTS:
+        return False
+    try:
+        page.screenshot(path=os.path.join(SCREENSHOTS_DIR, filename))
+        print(f"Saved error screenshot: {filename}")
+        return True
+    except Exception as save_err: # Handles failure to capture or write the screenshot.
+        print(f"Could not save error screenshot '{filename}': {save_err}")
+        return False
+
+def _scrape_one_playwright(page, project_entry):
+    """
+    Playwright counterpart of scrape_one(): scrapes one project's details
+    and promoter sections in page and returns a dict keyed by CSV_HEADERS.
+    """
+    project_index, detail_url, raw_project_name = project_entry
+    # Derives the identifier used in logs and screenshot names from the card's name, if one was extracted.
+    project_identifier_for_log = sanitize_filename(raw_project_name) if raw_project_name != "N/A" else f"Project_Loop_{project_index + 1}"
+    current_project_data_dict = {header: "N/A" for header in CSV_HEADERS}
+    current_project_data_dict["Sanitized_Project_Identifier_From_Card"] = project_identifier_for_log
+    current_project_data_dict["Raw_Project_Name_From_Card"] = raw_project_name
+    print(f"\n--- Processing Project Loop Index {project_index}: '{project_identifier_for_log}' ---")
+
+    try:
+        # Checks that a detail URL was collected for this card before navigating.
+        if not detail_url:
+            raise ValueError("No 'View Details' URL was collected for this project card.")
+
+        print(f"STEP {project_index+1}.B: Opening details page: {detail_url}")
+        page.goto(detail_url, wait_until="domcontentloaded")
+
+        print(f"STEP {project_index+1}.C: Waiting for project details content")
+        page.locator(f"xpath={PROJECT_DETAILS_CONTAINER_XPATH}").first.wait_for(state="visible", timeout=40000)
+        _playwright_wait_for_nonempty_text(
+            page,
+            f"{PROJECT_DETAILS_CONTAINER_XPATH}//label[normalize-space()='Project Name']/following-sibling::strong[1]",
+            15000, "project details"
+        )
+
+        print(f"STEP {project_index+1}.D: Scraping Project Details section")
+        try:
+            project_values = _playwright_run_script(page, _BULK_FIELDS_SCRIPT, PROJECT_DETAILS_CONTAINER_XPATH, list(PROJECT_DETAIL_FIELDS.values()))
+            # Treats a missing section as an error (as the Selenium engine does) rather than writing a silent all-N/A row.
+            if project_values is None:
+                raise ValueError("Project details section not found on the page.")
+            for header, label in PROJECT_DETAIL_FIELDS.items():
+                current_project_data_dict[header] = project_values.get(label) or "N/A"
+            print(f"  Scraped - Project Name: {current_project_data_dict['Project_Name_Scraped_From_Details_Page']},"
+                  f" Type: {current_project_data_dict['Project_Type_Scraped_From_Details_Page']},"
+                  f" RERA No: {current_project_data_dict['RERA_Reg_No_Scraped_From_Details_Page']}")
+        except Exception as scrape_details_e: # Handles errors encountered during scraping of project details.
+            print(f"ERROR scraping project details for '{project_identifier_for_log}': {type(scrape_details_e).__name__} - {str(scrape_details_e)}")
+            _playwright_save_error_screenshot(page, f"{project_identifier_for_log}_error_scraping_project_details.png")
+
+        # Clicks the tab; Playwright scrolls it into view and waits for it to be actionable on its own.
+        print(f"STEP {project_index+1}.E: Switching to Promoter Details")
+        page.locator(f"xpath={PROMOTER_TAB_XPATH}").first.click(timeout=30000)
+
+        print(f"STEP {project_index+1}.F: Waiting for Promoter Details content load")
+        page.locator(f"xpath={PROMOTER_DETAILS_ROW_XPATH}").first.wait_for(state="visible", timeout=40000)
+        _playwright_wait_for_nonempty_text(
+            page,
+            f"{PROMOTER_DETAILS_CONTAINER_XPATH}//label[normalize-space()='Company Name']/following-sibling::strong[1]",
+            15000, "promoter details"
+        )
 
-        # Defines the name for the output CSV file.
-        csv_file_path = "rera_odisha_scraped_data.csv"
-        # Gets the absolute path of the CSV file for a more informative log message.
-        abs_csv_path = os.path.abspath(csv_file_path)
-        print(f"\nAttempting to write scraped data to: {abs_csv_path}")
-        # Writes all collected project data to the specified CSV file.
+        print(f"STEP {project_index+1}.G: Scraping Promoter Details section")
+        try:
+            promoter_values = _playwright_run_script(page, _BULK_FIELDS_SCRIPT, PROMOTER_DETAILS_CONTAINER_XPATH, list(PROMOTER_DETAIL_FIELDS.values()))
+            # Treats a missing section as an error (as the Selenium engine does) rather than writing a silent all-N/A row.
+            if promoter_values is None:
+                raise ValueError("Promoter details section not found on the page.")
+            for header, label in PROMOTER_DETAIL_FIELDS.items():
+                current_project_data_dict[header] = promoter_values.get(label) or "N/A"
+            print(f"  Scraped - Promoter Co. Name: {current_project_data_dict['Promoter_Company_Name_Scraped']},"
+                  f" Promoter Reg. No: {current_project_data_dict['Promoter_Registration_No_Scraped']}")
+        except Exception as scrape_promoter_e: # Handles errors encountered during scraping of promoter details.
+            print(f"ERROR scraping promoter details for '{project_identifier_for_log}': {type(scrape_promoter_e).__name__} - {str(scrape_promoter_e)}")
+            _playwright_save_error_screenshot(page, f"{project_identifier_for_log}_error_scraping_promoter_details.png")
+
+    except Exception as project_loop_e: # Handles any unexpected errors during the processing of a single project.
+        print(f"!!! ERROR processing project loop for '{project_identifier_for_log}' (Project index {project_index}): {type(project_loop_e).__name__} - {str(project_loop_e)}")
+        _playwright_save_error_screenshot(page, f"{project_identifier_for_log}_MAIN_LOOP_ERROR.png")
+
+    return current_project_data_dict
+
+def scrape_projects_via_playwright(num_projects_to_process, csvfile, writer):
+    """
+    Scrapes the projects with a headless Playwright Chromium, appending each
+    row to csvfile through writer as soon as it is scraped. Playwright drives the browser
+    over one persistent connection rather than an HTTP request per
+    WebDriver command. Projects are scraped one after another in a single
+    page, unlike the Selenium engine's worker pool. Returns the number of
+    rows written, or None if Chromium could not be launched.
+    """
+    rows_written = 0
+    with sync_playwright() as playwright:
         try:
-            # Opens the CSV file in write mode with UTF-8 encoding.
-            with open(csv_file_path, 'w', newline='', encoding='utf-8') as csvfile:
-                # Creates a DictWriter object to write dictionaries to CSV, using defined headers.
-                writer = csv.DictWriter(csvfile, fieldnames=csv_headers)
-                # Writes the header row to the CSV file.
-                writer.writeheader()
-                # Writes all rows of project data to the CSV file.
-                writer.writerows(all_projects_scraped_data)
-            print(f"Data successfully written to {abs_csv_path}")
-        except IOError as io_e: # Specifically catches I/O errors during file writing.
-            print(f"ERROR: Could not write data to CSV file '{abs_csv_path}'. Reason: {io_e}")
-        except Exception as csv_e: # Catches any other unexpected errors during CSV writing.
-            print(f"An unexpected error occurred during CSV writing: {type(csv_e).__name__} - {str(csv_e)}")
+            browser = playwright.chromium.launch(headless=True)
+        except Exception as launch_e: # Handles a missing browser binary, e.g. when 'playwright install chromium' was never run.
+            print(f"Could not launch Playwright Chromium: {type(launch_e).__name__} - {str(launch_e)}")
+            return None
+        try:
+            context = browser.new_context(viewport={"width": 1920, "height": 1200})
+            # Injects the navbar-hiding stylesheet into every page the context loads, so it survives navigations.
+            context.add_init_script(script="document.addEventListener('DOMContentLoaded', () => {" + _HIDE_NAVBAR_SCRIPT + "});")
+            # Aborts requests for resources that are not needed to read the page text.
+            context.route("**/*", lambda route: route.abort() if route.request.resource_type in PLAYWRIGHT_BLOCKED_RESOURCE_TYPES else route.continue_())
+            page = context.new_page()
+
+            print("STEP 1: Loading main project list page")
+            page.goto(MAIN_PROJECT_LIST_URL, wait_until="domcontentloaded")
+            page.locator("div.project-card").first.wait_for(state="attached", timeout=30000)
+            _playwright_wait_for_nonempty_text(page, FIRST_CARD_TITLE_XPATH, 15000, "project card titles")
+            print("Main project list page loaded.")
+
+            print("STEP 2: Collecting project detail links from the list page")
+            # Reads every needed card's name and link in one evaluate call.
+            project_entries = _project_entries_from_cards(
+                _playwright_run_script(page, _COLLECT_PROJECT_CARDS_SCRIPT, num_projects_to_process)
+            )
+            print(f"Collected {len(project_entries)} project link(s) (requested {num_projects_to_process}).")
+
+            print(f"STEP 3: Scraping {len(project_entries)} project(s) with Playwright")
+            for project_entry in project_entries:
+                append_csv_row(csvfile, writer, _scrape_one_playwright(page, project_entry))
+                rows_written += 1
+            print("\nAll specified projects processed (or attempted).")
+        except Exception as e: # Catches any critical unexpected error, keeping the rows already written.
+            print(f"An critical unexpected error occurred in the Playwright engine: {type(e).__name__} - {str(e)}")
+        finally:
+            browser.close()
+    return rows_written
+
+def process_multiple_projects(num_projects_to_process=6, engine="selenium"):
+    # Creates the error screenshots directory if screenshots are enabled and it does not already exist on the filesystem.
+    if not SAVE_ERROR_SCREENSHOTS:
+        print("Error screenshots are disabled (set SCRAPER_SCREENSHOTS=1 to enable them).")
+    elif not os.path.exists(SCREENSHOTS_DIR):
+        os.makedirs(SCREENSHOTS_DIR)
+        print(f"Created directory for error screenshots: {SCREENSHOTS_DIR}")
+    else:
+        print(f"Directory for error screenshots '{SCREENSHOTS_DIR}' already exists.")
+
+    # Uses the Playwright engine when requested and installed; otherwise continues with the Selenium engine below.
+    if engine == "playwright" and sync_playwright is None:
+        print("The 'playwright' package is not installed; falling back to the Selenium engine.")
+    elif engine == "playwright":
+        abs_csv_path = os.path.abspath(CSV_FILE_PATH)
+        print(f"\nStreaming scraped data to: {abs_csv_path}")
+        csvfile, writer = open_csv_writer(buffering=CSV_STREAM_BUFFER_SIZE)
+        rows_written = None
+        try:
+            rows_written = scrape_projects_via_playwright(num_projects_to_process, csvfile, writer)
+        finally:
+            csvfile.close()
+        # Continues with the Selenium engine below if Chromium could not be launched; its CSV writer rewrites the file.
+        if rows_written is not None:
+            print(f"{rows_written} row(s) written to {abs_csv_path}")
+            print("Scraping process completed.")
+            return
+        print("Falling back to the Selenium engine.")
+
+    try:
+        # Reuses the worker pool (and its browsers) left over from a previous run in this process, if there is one.
+        pool = get_worker_pool()
+        # Loads the list page in one of the pooled browsers, so no separate Firefox sits idle while the workers scrape.
+        project_entries = pool.apply(collect_project_entries, (num_projects_to_process,))
+        if project_entries is None:
+            print("Could not collect any project links; nothing to scrape.")
+            return
+
+        # Opens the output CSV up front so each project's row is written as soon as it is scraped.
+        abs_csv_path = os.path.abspath(CSV_FILE_PATH)
+        print(f"\nStreaming scraped data to: {abs_csv_path}")
+        rows_written = 0
+        csvfile, writer = open_csv_writer(buffering=CSV_STREAM_BUFFER_SIZE)
+
+        # Distributes the collected projects across the worker processes, each with its own browser.
+        if project_entries:
+            print(f"STEP 3: Scraping {len(project_entries)} project(s) with {NUM_WORKERS} worker process(es)")
+            # Writes results in the original card order as they arrive, without holding them all in memory.
+            for project_row in pool.imap(scrape_one, project_entries):
+                append_csv_row(csvfile, writer, project_row)
+                rows_written += 1
+
+        # Indicates that all specified projects have been attempted.
+        print("\nAll specified projects processed (or attempted).")
 
     except Exception as e: # Catches any critical unexpected error in the main script execution.
         print(f"An critical unexpected error occurred in the main script: {type(e).__name__} - {str(e)}")
-        # Checks if the driver is still active and has a session ID.
-        if 'driver' in locals() and driver.session_id:
-            try:
-                # Attempts to save a screenshot for critical errors.
-                driver.save_screenshot(os.path.join(screenshots_dir, "critical_error_page_main_script_failure.png"))
-                print("Saved a screenshot for the critical error.")
-            except Exception as final_save_err: # Handles failure to save this final error screenshot.
-                print(f"Could not save final error screenshot: {final_save_err}")
     finally:
-        # Ensures the WebDriver quits properly, closing the browser, regardless of errors.
-        if 'driver' in locals() and driver.session_id:
-            driver.quit()
+        # Flushes and closes the output CSV, keeping every row written before any error.
+        if 'csvfile' in locals():
+            try:
+                csvfile.close()
+                print(f"{rows_written} row(s) written to {abs_csv_path}")
+            except IOError as io_e: # Specifically catches I/O errors while flushing the file.
+                print(f"ERROR: Could not write data to CSV file '{abs_csv_path}'. Reason: {io_e}")
+        # Leaves the worker pool running for the next call; its browsers are closed at interpreter exit.
         print("Scraping process completed.")
 
 if __name__ == "__main__":
+    # Parses the command-line flags that select the scraping path.
+    parser = argparse.ArgumentParser(description="Scrapes project and promoter details from the Odisha RERA project list.")
+    parser.add_argument("--engine", choices=("selenium", "playwright"), default="selenium",
+                        help=f"browser engine used for scraping (default: selenium, which spreads the projects across {NUM_WORKERS}"
+                             " worker processes); playwright scrapes them sequentially in one page")
+    args = parser.parse_args()
     # Calls the main processing function, specifying the number of projects to scrape.
-    process_multiple_projects(num_projects_to_process=6)
\ No newline at end of file
+    process_multiple_projects(num_projects_to_process=6, engine=args.engine)